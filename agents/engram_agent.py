@@ -6,6 +6,7 @@ Handles message routing and response formatting across platforms
 import logging
 import json
 import asyncio
+import random
 import websockets
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -18,6 +19,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from skills.engram.engram_skill import EngramSkill
 
+try:
+    from orjson import dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps(obj):
+        # Gateway expects text frames, so keep sending str rather than bytes
+        return _orjson_dumps(obj).decode()
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,7 +75,7 @@ class EngramAgent:
             "ETH": {"amount": 2.0, "avg_price": 2800}
         }
         
-        logger.info(f"Engram agent initialized for gateway {self.gateway_host}:{self.gateway_port}")
+        logger.info("Engram agent initialized for gateway %s:%s", self.gateway_host, self.gateway_port)
     
     async def connect(self):
         """
@@ -82,13 +92,13 @@ class EngramAgent:
         uri = f"ws://{self.gateway_host}:{self.gateway_port}"
         
         try:
-            logger.info(f"Attempting connection to ws://{self.gateway_host}:{self.gateway_port}")
+            logger.info("Attempting connection to ws://%s:%s", self.gateway_host, self.gateway_port)
             
             # Connect without subprotocols - OpenClaw doesn't use them
             # Add timeout to prevent indefinite hanging
             self.websocket = await asyncio.wait_for(websockets.connect(uri), timeout=10)
             
-            logger.info(f"[OK] Connected to OpenClaw gateway")
+            logger.info("[OK] Connected to OpenClaw gateway")
             
             # Handle authentication challenge-response
             if await self._authenticate():
@@ -101,7 +111,7 @@ class EngramAgent:
                 return False
             
         except Exception as e:
-            logger.error(f"[ERROR] Failed to connect to gateway: {e}")
+            logger.error("[ERROR] Failed to connect to gateway: %s", e)
             return False
     
     async def _authenticate(self) -> bool:
@@ -116,15 +126,15 @@ class EngramAgent:
             # Wait for initial challenge message
             logger.info("Waiting for authentication challenge...")
             message = await asyncio.wait_for(self.websocket.recv(), timeout=5.0)
-            data = json.loads(message)
+            data = json_loads(message)
             
-            logger.debug(f"Received: {data}")
+            logger.debug("Received: %s", data)
             
             # Check if it's a connection challenge
             if data.get("type") == "event" and data.get("event") == "connect.challenge":
                 nonce = data.get("payload", {}).get("nonce")
                 token = self.gateway_token or "2a965e2334ac2b0a9d4d255f86e479db5a3b75a992affbdc"
-                logger.debug(f"Using token: {token[:10]}...{token[-10:]} (length: {len(token)})")
+                logger.debug("Using token: %s...%s (length: %s)", token[:10], token[-10:], len(token))
                 
                 # Send connect request with proper ClawdBot protocol
                 connect_msg = {
@@ -154,16 +164,16 @@ class EngramAgent:
                 
                 # Wait for connect response
                 message = await asyncio.wait_for(self.websocket.recv(), timeout=5.0)
-                data = json.loads(message)
+                data = json_loads(message)
                 
                 if data.get("type") == "res" and data.get("ok") == True:
                     logger.info("[OK] Authentication successful")
                     return True
                 else:
-                    logger.error(f"[ERROR] Authentication failed: {data}")
+                    logger.error("[ERROR] Authentication failed: %s", data)
                     return False
             else:
-                logger.warning(f"[WARN] Unexpected initial message: {data}")
+                logger.warning("[WARN] Unexpected initial message: %s", data)
                 # Continue anyway - might be a different protocol version
                 return True
                 
@@ -171,7 +181,7 @@ class EngramAgent:
             logger.error("[ERROR] Authentication timeout")
             return False
         except Exception as e:
-            logger.error(f"[ERROR] Authentication error: {e}")
+            logger.error("[ERROR] Authentication error: %s", e)
             return False
     
     async def _send_hello(self):
@@ -190,7 +200,7 @@ class EngramAgent:
             raise Exception("WebSocket not connected")
         
         # Proper JSON framing for ClawdBot
-        json_str = json.dumps(message)
+        json_str = json_dumps(message)
         await self.websocket.send(json_str)
     
     async def _send_pong(self, ping_data: Any):
@@ -235,7 +245,7 @@ class EngramAgent:
             req_id = message.get("id")
             params = message.get("params", {})
             
-            logger.info(f"[REQUEST] Method: {method}, ID: {req_id}")
+            logger.info("[REQUEST] Method: %s, ID: %s", method, req_id)
             
             # Handle chat.send method (Telegram messages routed through ClawdBot)
             if method == "chat.send":
@@ -261,7 +271,7 @@ class EngramAgent:
                 }
             
             # Handle other methods
-            logger.info(f"[REQUEST] Unhandled method: {method}")
+            logger.info("[REQUEST] Unhandled method: %s", method)
             return {
                 "type": "res",
                 "id": req_id,
@@ -293,7 +303,7 @@ class EngramAgent:
         
         # Handle response messages (from other agents)
         if msg_type == "response":
-            logger.debug(f"[OK] Received response: {message.get('response', '')[:100]}...")
+            logger.debug("[OK] Received response: %s...", message.get('response', '')[:100])
             return None
         
         # Handle health check
@@ -306,7 +316,7 @@ class EngramAgent:
             }
         
         # Unknown message type
-        logger.warning(f"[WARN] Unknown message type: {msg_type}")
+        logger.warning("[WARN] Unknown message type: %s", msg_type)
         return None
     
     async def _handle_event(self, event: Dict[str, Any]):
@@ -320,8 +330,8 @@ class EngramAgent:
         event_type = event.get("event", event.get("event_type", "unknown"))
         payload = event.get("payload", event.get("data", {}))
         
-        logger.info(f"[EVENT] Received event: {event_type}")
-        logger.debug(f"[EVENT] Payload: {payload}")
+        logger.info("[EVENT] Received event: %s", event_type)
+        logger.debug("[EVENT] Payload: %s", payload)
         
         # Process different event types
         if event_type == "auth.success":
@@ -329,14 +339,14 @@ class EngramAgent:
         elif event_type == "agent_registered":
             logger.info("[OK] Agent successfully registered with gateway")
         elif event_type == "channel_connected":
-            logger.info(f"[OK] Channel connected: {payload.get('channel')}")
+            logger.info("[OK] Channel connected: %s", payload.get('channel'))
         elif event_type == "channel_disconnected":
-            logger.warning(f"[WARN] Channel disconnected: {payload.get('channel')}")
+            logger.warning("[WARN] Channel disconnected: %s", payload.get('channel'))
         elif event_type == "connect.challenge":
             # Already handled in _authenticate
             pass
         else:
-            logger.debug(f"[EVENT] Unhandled event type: {event_type}")
+            logger.debug("[EVENT] Unhandled event type: %s", event_type)
     
     async def _handle_command(self, command: str, context: Dict[str, Any]) -> str:
         """
@@ -490,9 +500,9 @@ Examples:
             async for message in self.websocket:
                 try:
                     # Parse JSON message
-                    data = json.loads(message)
-                    logger.info(f"[RECV] Type: {data.get('type', 'unknown')}, Event: {data.get('event', 'N/A')}, Method: {data.get('method', 'N/A')}")
-                    logger.debug(f"[RECV FULL] {data}")
+                    data = json_loads(message)
+                    logger.info("[RECV] Type: %s, Event: %s, Method: %s", data.get('type', 'unknown'), data.get('event', 'N/A'), data.get('method', 'N/A'))
+                    logger.debug("[RECV FULL] %s", data)
                     
                     # Handle message
                     response = await self.handle_message(data)
@@ -502,14 +512,14 @@ Examples:
                         await self._send_message(response)
                         
                 except json.JSONDecodeError as e:
-                    logger.error(f"[ERROR] Invalid JSON received: {e}")
+                    logger.error("[ERROR] Invalid JSON received: %s", e)
                 except Exception as e:
-                    logger.error(f"[ERROR] Error handling message: {e}")
+                    logger.error("[ERROR] Error handling message: %s", e)
                     
         except websockets.exceptions.ConnectionClosed as e:
-            logger.warning(f"[WARN] WebSocket connection closed: {e}")
+            logger.warning("[WARN] WebSocket connection closed: %s", e)
         except Exception as e:
-            logger.error(f"[ERROR] Error in listen loop: {e}")
+            logger.error("[ERROR] Error in listen loop: %s", e)
     
     async def run(self):
         """
@@ -526,8 +536,9 @@ Examples:
                 
                 # Connection lost, attempt reconnect
                 if self.running:
-                    logger.info(f"Reconnecting in {self.reconnect_delay}s...")
-                    await asyncio.sleep(self.reconnect_delay)
+                    logger.info("Reconnecting in %ss...", self.reconnect_delay)
+                    # Jitter keeps agents that dropped together from reconnecting in lockstep
+                    await asyncio.sleep(self.reconnect_delay + random.uniform(0, self.reconnect_delay / 2))
                     
                     # Exponential backoff
                     self.reconnect_delay = min(
@@ -539,9 +550,9 @@ Examples:
                 logger.info("Received shutdown signal")
                 self.running = False
             except Exception as e:
-                logger.error(f"Error in run loop: {e}")
+                logger.error("Error in run loop: %s", e)
                 if self.running:
-                    await asyncio.sleep(self.reconnect_delay)
+                    await asyncio.sleep(self.reconnect_delay + random.uniform(0, self.reconnect_delay / 2))
     
     async def shutdown(self):
         """Graceful shutdown"""
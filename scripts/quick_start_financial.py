@@ -117,13 +117,16 @@ def test_financial_endpoints():
     """Test all financial API endpoints."""
     base_url = "http://localhost:8000"
     
+    # One session so all endpoint checks reuse the same keep-alive connection
+    session = requests.Session()
+    
     print("🧪 Testing Financial Neural Capacity Endpoints")
     print("="*50)
     
     # Test sentiment endpoint
     print("\\n📊 Testing sentiment endpoint...")
     try:
-        response = requests.get(f"{base_url}/api/engram/financial/sentiment", timeout=10)
+        response = session.get(f"{base_url}/api/engram/financial/sentiment", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"   ✅ Sentiment: {data['market_sentiment']:.3f} ({data['market_direction']})")
@@ -135,7 +138,7 @@ def test_financial_endpoints():
     # Test trends endpoint
     print("\\n📈 Testing trends endpoint...")
     try:
-        response = requests.get(f"{base_url}/api/engram/financial/trends", timeout=10)
+        response = session.get(f"{base_url}/api/engram/financial/trends", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"   ✅ Trend: {data['current_trend']} (strength: {data['trend_strength']:.3f})")
@@ -147,7 +150,7 @@ def test_financial_endpoints():
     # Test comprehensive analysis
     print("\\n🎯 Testing comprehensive analysis...")
     try:
-        response = requests.get(f"{base_url}/api/engram/financial/analysis", timeout=10)
+        response = session.get(f"{base_url}/api/engram/financial/analysis", timeout=10)
         if response.status_code == 200:
             data = response.json()
             health = data['executive_summary']['overall_health']
@@ -160,7 +163,7 @@ def test_financial_endpoints():
     # Test health endpoint
     print("\\n🏥 Testing health endpoint...")
     try:
-        response = requests.get(f"{base_url}/health/financial", timeout=10)
+        response = session.get(f"{base_url}/health/financial", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"   ✅ System Status: {data['status']}")
@@ -169,6 +172,7 @@ def test_financial_endpoints():
     except Exception as e:
         print(f"   ❌ Health endpoint error: {str(e)}")
     
+    session.close()
     print("\\n🎉 Financial Neural Capacity Integration Test Complete!")
 
 if __name__ == "__main__":
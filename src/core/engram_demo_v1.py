@@ -39,6 +39,7 @@ import websockets
 import json
 import threading
 import time
+import random
 import requests
 
 @dataclass
@@ -443,7 +444,8 @@ class ClawdBotClient:
                     self.connected = False
                     return
                 print(f"[WARN] ClawdBot connection error (retry {retries}/{max_retries}): {e}")
-                await asyncio.sleep(retry_delay)
+                # Jittered backoff so restarted clients don't hit the gateway in lockstep
+                await asyncio.sleep(retry_delay + random.uniform(0, retry_delay / 2))
                 retry_delay = min(retry_delay * 2, 10)
 
     async def _connect(self):
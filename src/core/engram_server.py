@@ -11,16 +11,21 @@ from starlette.responses import Response
 from pydantic import BaseModel
 from typing import List, Optional
 import argparse
-import glob
 import hashlib
 import uvicorn
 from short_conv_model import LlamaShortConv, ModelConfig, hash_text_to_id
 import torch
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from financial_data_manager import get_financial_manager
 from neural_hashing import create_neural_hash_module
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 class CSPMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request, call_next):
         response: Response = await call_next(request)
@@ -70,29 +75,58 @@ class ChatCompletionRequest(BaseModel):
 class ToolRequest(BaseModel):
     command: str
 
-def get_project_context():
+# Project context keyed by (path, mtime_ns), re-read only when the file changes
+_project_context_cache = {}
+
+def get_project_context(path="openspec/project.md"):
     """Provides ONLY the core logic summary to the model."""
     try:
-        with open("openspec/project.md", 'r') as file:
-            return f"CORE LOGIC:\n{file.read().strip()}\n"
+        key = (path, os.stat(path).st_mtime_ns)
+        context = _project_context_cache.get(key)
+        if context is None:
+            with open(path, 'r') as file:
+                context = f"CORE LOGIC:\n{file.read().strip()}\n"
+            _project_context_cache.clear()
+            _project_context_cache[key] = context
+        return context
     except:
         return "CORE LOGIC: Engram Intelligent Hub - Neural context management.\n"
 
+# Dependency and build directories that never hold project sources
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv", "build", "dist"})
+
+def iter_project_files(directory="", suffixes=(".py", ".md")):
+    """Yields project file paths with the given suffixes in a single directory walk."""
+    with os.scandir(directory or ".") as entries:
+        for entry in entries:
+            # Hidden entries (.git, .venv, .tox, ...) were never matched by the
+            # previous '**' globs either
+            if entry.name.startswith("."):
+                continue
+            path = os.path.join(directory, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from iter_project_files(path, suffixes)
+            elif entry.name.endswith(suffixes):
+                yield path
+
+def fingerprint_file(f):
+    """Reads a single file and returns its path with its fingerprint entry."""
+    with open(f, 'r', encoding='utf-8', errors='ignore') as file:
+        content = file.read()
+    # Generate a stable ID for the file
+    token_id = hash_text_to_id(content)
+    # Simulate the Neural Hashing logic
+    return f, {
+        "token_id": token_id,
+        "label": os.path.basename(f)
+    }
+
 def get_neural_fingerprint():
     """Generates hashes for all files in the project for context anchoring."""
-    files = glob.glob("**/*.py", recursive=True) + glob.glob("**/*.md", recursive=True)
-    fingerprint = {}
-    for f in files:
-        with open(f, 'r', encoding='utf-8', errors='ignore') as file:
-            content = file.read()
-            # Generate a stable ID for the file
-            token_id = hash_text_to_id(content)
-            # Simulate the Neural Hashing logic
-            fingerprint[f] = {
-                "token_id": token_id,
-                "label": f.split('/')[-1]
-            }
-    return fingerprint
+    # File reads are independent and I/O-bound, so overlap them in a thread pool
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        return dict(executor.map(fingerprint_file, iter_project_files()))
 
 # Initialize the model once
 print("🧠 Initializing Engram Neural Core...")
@@ -155,7 +189,7 @@ async def chat_completions(request: ChatCompletionRequest):
                 response = await client.post(url, json=payload)
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = json_loads(response.content)
                     print(f"✅ Success from {url}")
                     return result
                 else:
@@ -203,7 +237,7 @@ async def root():
 async def list_specs():
     """Returns a list of markdown files in the openspec directory."""
     try:
-        spec_files = glob.glob("openspec/**/*.md", recursive=True)
+        spec_files = glob.iglob("openspec/**/*.md", recursive=True)
         return [f.replace("\\", "/") for f in spec_files]
     except Exception as e:
         print(f"Error listing specs: {e}")
@@ -80,8 +80,14 @@ class NeuralHashingModule:
             "financial_hashes": 0
         }
         
+        # Running count of non-zero context slots, kept in sync by update_context
+        self._nonzero_memory = 0
+        
         # Cache financial keywords for O(1) lookup
         self.financial_keywords_set = set(token.lower() for token in config.financial_keywords) if config.financial_keywords else set()
+        
+        # Sinusoidal frequency terms keyed by embedding dimension
+        self._div_term_cache: Dict[int, torch.Tensor] = {}
 
     def classify_token(self, token: str) -> TokenType:
         """
@@ -102,6 +108,38 @@ class NeuralHashingModule:
             return TokenType.FINANCIAL_ENTITY
             
         return TokenType.GENERAL
+
+    def classify_tokens(self, tokens: List[str]) -> np.ndarray:
+        """
+        Classifies a batch of tokens in a single pass.
+        
+        Args:
+            tokens (List[str]): Input tokens.
+            
+        Returns:
+            np.ndarray: int8 mask with 1 for financial entities and 0 otherwise.
+        """
+        financial = TokenType.FINANCIAL_ENTITY
+        return np.fromiter(
+            (self.classify_token(token) is financial for token in tokens),
+            dtype=np.int8,
+            count=len(tokens)
+        )
+    
+    def token_index(self, token: str) -> int:
+        """
+        Maps a token to the base index used by the hashing scheme.
+        
+        Args:
+            token (str): Input token.
+            
+        Returns:
+            int: Base index for the token.
+        """
+        if token not in self.token_to_index:
+            # Handle unknown tokens with fallback hashing
+            return hash(token) % len(self.config.primes)
+        return self.token_to_index[token]
     
     def hash_token(self, token: str, position: int = 0) -> int:
         """
@@ -114,12 +152,7 @@ class NeuralHashingModule:
         Returns:
             int: Hash value derived from prime indices and bitwise XOR.
         """
-        if token not in self.token_to_index:
-            # Handle unknown tokens with fallback hashing
-            token_hash = hash(token) % len(self.config.primes)
-            idx = token_hash
-        else:
-            idx = self.token_to_index[token]
+        idx = self.token_index(token)
         
         # Determine token type and select prime set
         token_type = self.classify_token(token)
@@ -169,7 +202,39 @@ class NeuralHashingModule:
             hash_val = self.hash_token(token, position=i)
             hashes.append(hash_val)
         return hashes
-    
+
+    def hash_sequence_ids(self, token_ids: torch.Tensor) -> torch.Tensor:
+        """
+        Hashes a sequence of pre-tokenized IDs in a single vectorized pass.
+
+        Token IDs are treated as general-vocabulary indices, so no string
+        classification is performed.
+
+        Args:
+            token_ids (torch.Tensor): 1-D tensor of token indices.
+
+        Returns:
+            torch.Tensor: 16-bit hash values for the token sequence.
+        """
+        token_ids = token_ids.to(device=self.device, dtype=torch.long)
+        positions = torch.arange(token_ids.numel(), device=self.device, dtype=torch.long)
+        base = token_ids + positions
+
+        # Weighted XOR hash: Prime * (index + position + i), reduced across primes
+        combined_hash = torch.zeros_like(base)
+        for i, prime in enumerate(self.config.primes):
+            combined_hash ^= prime * (base + i)
+
+        final_hashes = combined_hash & ((1 << 16) - 1)  # 16-bit hash
+
+        # Update statistics
+        new_hashes = set(torch.unique(final_hashes).tolist()) - self.hash_stats["unique_hashes"]
+        self.hash_stats["total_hashes"] += token_ids.numel()
+        self.hash_stats["collision_count"] += token_ids.numel() - len(new_hashes)
+        self.hash_stats["unique_hashes"].update(new_hashes)
+
+        return final_hashes
+
     def update_context(self, tokens: List[str], hashes: List[int] = None) -> None:
         """
         Updates the context memory with hashed token IDs.
@@ -183,11 +248,34 @@ class NeuralHashingModule:
         
         # Convert to tensor and update context memory
         hash_tensor = torch.tensor(hashes, dtype=torch.long, device=self.device)
+        self._write_context(hash_tensor)
+    
+    def update_context_ids(self, token_ids: torch.Tensor) -> None:
+        """
+        Updates the context memory from pre-tokenized IDs via the vectorized
+        hashing path, skipping per-token string classification.
         
+        Args:
+            token_ids (torch.Tensor): 1-D tensor of token indices.
+        """
+        self._write_context(self.hash_sequence_ids(token_ids))
+    
+    def _write_context(self, hash_tensor: torch.Tensor) -> None:
+        """
+        Writes hash values to the start of the context memory.
+        
+        Args:
+            hash_tensor (torch.Tensor): Hash values to store.
+        """
         # Ensure we don't exceed context memory bounds
-        seq_len = min(len(hashes), self.config.max_context_length)
+        seq_len = min(hash_tensor.numel(), self.config.max_context_length)
         
-        # Update context memory with new hashes
+        # Update context memory with new hashes, adjusting the non-zero count
+        # for the overwritten slice only
+        self._nonzero_memory += (
+            torch.count_nonzero(hash_tensor[:seq_len]).item() -
+            torch.count_nonzero(self.context_memory[:seq_len]).item()
+        )
         self.context_memory[:seq_len] = hash_tensor[:seq_len]
     
     def get_context_hashes(self, start_pos: int = 0, length: int = None) -> torch.Tensor:
@@ -210,10 +298,12 @@ class NeuralHashingModule:
     def reset_context(self) -> None:
         """Resets the context memory and statistics."""
         self.context_memory.zero_()
+        self._nonzero_memory = 0
         self.hash_stats = {
             "total_hashes": 0,
             "unique_hashes": set(),
-            "collision_count": 0
+            "collision_count": 0,
+            "financial_hashes": 0
         }
     
     def get_hash_statistics(self) -> Dict:
@@ -231,10 +321,7 @@ class NeuralHashingModule:
                 self.hash_stats["collision_count"] / max(1, self.hash_stats["total_hashes"])
             ),
             "financial_hashes": self.hash_stats["financial_hashes"],
-            "memory_utilization": (
-                torch.count_nonzero(self.context_memory).item() / 
-                self.config.max_context_length
-            )
+            "memory_utilization": self._nonzero_memory / self.config.max_context_length
         }
     
     def integrate_with_engram(self, engram_layer_output: torch.Tensor) -> torch.Tensor:
@@ -260,6 +347,26 @@ class NeuralHashingModule:
         
         return enhanced_output
     
+    def _get_div_term(self, embed_dim: int) -> torch.Tensor:
+        """
+        Returns the sinusoidal frequency terms for an embedding dimension,
+        computing them on first use only.
+        
+        Args:
+            embed_dim (int): Target embedding dimension.
+            
+        Returns:
+            torch.Tensor: Frequency terms of shape (embed_dim // 2,).
+        """
+        div_term = self._div_term_cache.get(embed_dim)
+        if div_term is None:
+            div_term = torch.exp(
+                torch.arange(0, embed_dim, 2, device=self.device, dtype=torch.float32) * 
+                -(np.log(10000.0) / embed_dim)
+            )
+            self._div_term_cache[embed_dim] = div_term
+        return div_term
+    
     def _hash_to_embedding(self, hashes: torch.Tensor, embed_dim: int) -> torch.Tensor:
         """
         Converts hash values to embedding-like representations.
@@ -272,11 +379,7 @@ class NeuralHashingModule:
             torch.Tensor: Hash-based embeddings.
         """
         # Simple hash-to-embedding conversion using sine/cosine encoding
-        positions = torch.arange(embed_dim, device=self.device, dtype=torch.float32)
-        div_term = torch.exp(
-            torch.arange(0, embed_dim, 2, device=self.device, dtype=torch.float32) * 
-            -(np.log(10000.0) / embed_dim)
-        )
+        div_term = self._get_div_term(embed_dim)
         
         # Convert hashes to float for encoding
         hash_floats = hashes.float().unsqueeze(-1)
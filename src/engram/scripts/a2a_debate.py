@@ -24,8 +24,10 @@ if env_path.exists():
     with open(env_path) as f:
         for line in f:
             line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
+            if not line or line[:1] == '#':
+                continue
+            key, sep, value = line.partition('=')
+            if sep:
                 os.environ.setdefault(key, value)
 
 
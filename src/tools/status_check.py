@@ -5,11 +5,15 @@ Engram-FreqTrade Quick Status Check
 Simple status check that avoids dependency conflicts.
 """
 
-import sys
 import os
 import json
 import subprocess
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 def run_cmd(cmd):
     """Run command and return result."""
     try:
@@ -21,8 +25,8 @@ def run_cmd(cmd):
 def check_config():
     """Check configuration file."""
     try:
-        with open('engram_freqtrade_config.json', 'r') as f:
-            config = json.load(f)
+        with open('engram_freqtrade_config.json', 'rb') as f:
+            config = json_loads(f.read())
         
         print("✅ Configuration loaded successfully!")
         print(f"📊 Trading pairs: {config['freqtrade']['exchange']['pair_whitelist']}")
@@ -34,6 +38,14 @@ def check_config():
         print(f"❌ Config error: {e}")
         return False
 
+def existing_files(directory='.'):
+    """Return the names of regular files in a directory from a single scan."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
 def check_files():
     """Check if required files exist."""
     required_files = [
@@ -43,10 +55,9 @@ def check_files():
         'launch_engram_trader.py'
     ]
     
-    missing = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing.append(file)
+    # One directory scan instead of a stat() per required file
+    present = existing_files()
+    missing = [file for file in required_files if file not in present]
     
     if missing:
         print(f"❌ Missing files: {missing}")
@@ -77,6 +88,15 @@ def check_freqtrade_install():
         print("❌ FreqTrade not found in PATH")
         return False
 
+def run_check(name, check_func):
+    """Run a single check, converting exceptions into a failed result."""
+    print(f"\n🔍 Checking {name}...")
+    try:
+        return name, check_func()
+    except Exception as e:
+        print(f"❌ {name} check failed: {e}")
+        return name, False
+
 def main():
     """Run status check."""
     print("🚀 Engram-FreqTrade Status Check")
@@ -89,15 +109,8 @@ def main():
         ("FreqTrade Binary", check_freqtrade_install),
     ]
     
-    results = []
-    for name, check_func in checks:
-        print(f"\n🔍 Checking {name}...")
-        try:
-            result = check_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"❌ {name} check failed: {e}")
-            results.append((name, False))
+    # Checks print as they go, so run them in order to keep output under its header
+    results = [run_check(name, check_func) for name, check_func in checks]
     
     print("\n" + "=" * 40)
     print("📊 Status Summary:")
@@ -9,13 +9,83 @@ and neural pathways.
 """
 
 import asyncio
+import logging
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; fall back to plain Python execution
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 from financial_reddit_ingestion import create_reddit_ingestion
 from financial_neural_pathways import create_financial_neural_pathways
 from neural_hashing import create_neural_hash_module
 from financial_reddit_ingestion import FinancialCommunity
 
+logger = logging.getLogger(__name__)
+
+_EXPECTED_ENDPOINTS = (
+    "/api/engram/financial/sentiment",
+    "/api/engram/financial/trends",
+    "/api/engram/financial/analysis"
+)
+
+@njit(cache=True)
+def _gen_sentiment_series(n):
+    """Generate a gradually increasing sentiment series of length n."""
+    out = np.empty(n)
+    for i in range(n):
+        out[i] = 0.5 * (i / n)
+    return out
+
+@njit(cache=True)
+def _momentum(series):
+    """Difference between the last two points of a sentiment series."""
+    if series.shape[0] < 2:
+        return 0.0
+    return series[-1] - series[-2]
+
+def _build_community_posts(financial_pathways, community, posts):
+    """Create sentiment-tagged mock posts for a single community."""
+    community_posts = [None] * len(posts)
+    for idx, post_data in enumerate(posts):
+        # Create mock post
+        post = type('MockPost', (), {
+            'id': f"mock_{int(time.time() * 1000)}",
+            'title': post_data['title'],
+            'content': f"This is a mock post from {community} demonstrating sentiment analysis.",
+            'subreddit': community,
+            'score': 100,
+            'num_comments': 25,
+            'entities': ['market', 'trading', 'investment']
+        })()
+        
+        # Add sentiment analysis
+        analysis = financial_pathways.analyze_sentiment(
+            post_data['title'] + ' ' + post.content,
+            post.entities
+        )
+        post.sentiment_score = analysis['sentiment_score']
+        post.influence_weight = 0.75
+        
+        community_posts[idx] = post
+    
+    return community_posts
+
+def _analyze_communities(financial_pathways, community_data):
+    """Build and analyze every community's posts in order."""
+    results = []
+    for community, posts in community_data.items():
+        community_posts = _build_community_posts(financial_pathways, community, posts)
+        results.append((community_posts, financial_pathways.analyze_post_batch(community_posts)))
+    return results
+
 async def test_financial_neural_capacity():
     """Test the complete financial neural capacity integration."""
     
@@ -83,7 +153,6 @@ async def test_financial_neural_capacity():
         
         # Mock data for demonstration
         print("   📊 Creating mock financial posts for demonstration...")
-        mock_posts = []
         
         # Simulate different community sentiments
         community_data = {
@@ -101,46 +170,31 @@ async def test_financial_neural_capacity():
             ]
         }
         
-        for community, posts in community_data.items():
-            for post_data in posts:
-                # Create mock post
-                post = type('MockPost', (), {
-                    'id': f"mock_{int(time.time() * 1000)}",
-                    'title': post_data['title'],
-                    'content': f"This is a mock post from {community} demonstrating sentiment analysis.",
-                    'subreddit': community,
-                    'score': 100,
-                    'num_comments': 25,
-                    'entities': ['market', 'trading', 'investment']
-                })()
-                
-                # Add sentiment analysis
-                analysis = financial_pathways.analyze_sentiment(
-                    post_data['title'] + ' ' + post.content,
-                    post.entities
-                )
-                post.sentiment_score = analysis['sentiment_score']
-                post.influence_weight = 0.75
-                
-                mock_posts.append(post)
-        
+        # Pathways and hasher mutate unlocked state (entity ids, hash stats), so
+        # all communities are analyzed on one worker thread, off the event loop
+        community_results = await asyncio.to_thread(
+            _analyze_communities, financial_pathways, community_data
+        )
+        mock_posts = [post for posts, _ in community_results for post in posts]
         print(f"   ✅ Created {len(mock_posts)} mock financial posts")
         
-        # Process posts through neural pathways
-        post_analyses = financial_pathways.analyze_post_batch(mock_posts)
+        post_analyses = [analysis for _, analyses in community_results for analysis in analyses]
         print(f"   ✅ Analyzed {len(post_analyses)} posts through neural pathways")
         
         # Calculate community sentiments
+        scores = np.array([p['sentiment_score'] for p in post_analyses], dtype=np.float64)
+        confidences = np.array([p['confidence'] for p in post_analyses], dtype=np.float64)
+        subreddits = np.array([p['subreddit'] for p in post_analyses])
+        
         community_sentiments = {}
         for community in community_data.keys():
-            community_posts = [p for p in post_analyses if p['subreddit'] == community]
-            if community_posts:
-                avg_sentiment = sum(p['sentiment_score'] for p in community_posts) / len(community_posts)
-                avg_confidence = sum(p['confidence'] for p in community_posts) / len(community_posts)
+            mask = subreddits == community
+            post_count = int(mask.sum())
+            if post_count:
                 community_sentiments[community] = {
-                    'sentiment_score': avg_sentiment,
-                    'confidence': avg_confidence,
-                    'post_count': len(community_posts)
+                    'sentiment_score': float(scores[mask].mean()),
+                    'confidence': float(confidences[mask].mean()),
+                    'post_count': post_count
                 }
         
         print("\n📈 Community Sentiment Analysis:")
@@ -152,12 +206,13 @@ async def test_financial_neural_capacity():
         print("\n📊 5. Testing Market Trend Detection...")
         
         # Create mock sentiment history
+        sentiment_series = _gen_sentiment_series(10)  # Gradually increasing sentiment
+        now = datetime.now()
         sentiment_history = []
-        for i in range(10):
-            sentiment_score = 0.5 * (i / 10)  # Gradually increasing sentiment
+        for i, sentiment_score in enumerate(sentiment_series):
             sentiment_obj = type('MockSentiment', (), {
-                'sentiment_score': sentiment_score,
-                'timestamp': datetime.now()
+                'sentiment_score': float(sentiment_score),
+                'timestamp': now + timedelta(seconds=i)
             })()
             sentiment_history.append(sentiment_obj)
         
@@ -167,6 +222,11 @@ async def test_financial_neural_capacity():
         print(f"   Sentiment Momentum: {trend_analysis.get('sentiment_momentum', 0.0):.3f}")
         print(f"   Reversal Potential: {trend_analysis.get('reversal_potential', 0.0):.3f}")
         
+        expected_momentum = _momentum(sentiment_series)
+        if not np.isclose(trend_analysis.get('sentiment_momentum', 0.0), expected_momentum):
+            print(f"   ❌ Sentiment momentum does not match expected {expected_momentum:.3f}")
+            return False
+        
         # 6. Test Neural Hash Integration
         print("\n🔗 6. Testing Neural Hash Integration...")
         
@@ -174,9 +234,9 @@ async def test_financial_neural_capacity():
         financial_terms = ["bullish", "bearish", "volatility", "momentum", "Bitcoin", "Ethereum"]
         financial_hashes = neural_hasher.hash_sequence(financial_terms)
         
-        print("   Financial Term Hashes:")
-        for term, hash_val in zip(financial_terms, financial_hashes):
-            print(f"     {term}: {hash_val}")
+        lines = ["   Financial Term Hashes:"]
+        lines.extend(f"     {term}: {hash_val}" for term, hash_val in zip(financial_terms, financial_hashes))
+        print("\n".join(lines))
         
         # Update context
         neural_hasher.update_context(financial_terms, financial_hashes)
@@ -213,8 +273,7 @@ async def test_financial_neural_capacity():
         
     except Exception as e:
         print(f"❌ Error during testing: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Financial neural capacity test failed", exc_info=True)
         return False
 
 def test_engram_server_integration():
@@ -224,14 +283,8 @@ def test_engram_server_integration():
     # This would test the actual API endpoints
     # For now, we'll demonstrate the expected structure
     
-    expected_endpoints = [
-        "/api/engram/financial/sentiment",
-        "/api/engram/financial/trends",
-        "/api/engram/financial/analysis"
-    ]
-    
     print("   Expected API Endpoints:")
-    for endpoint in expected_endpoints:
+    for endpoint in _EXPECTED_ENDPOINTS:
         print(f"     GET {endpoint}")
     
     print("   ✅ Server integration structure validated")
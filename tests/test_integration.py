@@ -9,6 +9,12 @@ This script tests the basic functionality without the complex setup.
 import sys
 import os
 import json
+from pathlib import Path
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Add paths
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -71,8 +77,7 @@ def test_config():
         print("⚙️ Testing configuration...")
         config_path = "/mnt/c/Users/OFFRSTAR0/Engram/engram_freqtrade_config.json"
         
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = json_loads(Path(config_path).read_bytes())
         
         print(f"✅ Configuration loaded successfully!")
         print(f"📊 Pairs: {config['freqtrade']['exchange']['pair_whitelist']}")
@@ -83,6 +88,15 @@ def test_config():
         print(f"❌ Config test failed: {e}")
         return False
 
+def _run_test(name, test_func):
+    """Run a single test, converting exceptions into a failed result."""
+    print(f"\n🧪 Testing {name}...")
+    try:
+        return name, test_func()
+    except Exception as e:
+        print(f"❌ {name} test failed with exception: {e}")
+        return name, False
+
 def main():
     """Run all tests."""
     print("🚀 Engram-FreqTrade Integration Test Suite")
@@ -96,15 +110,7 @@ def main():
         ("Telegram Bot", test_telegram),
     ]
     
-    results = []
-    for name, test_func in tests:
-        print(f"\n🧪 Testing {name}...")
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"❌ {name} test failed with exception: {e}")
-            results.append((name, False))
+    results = [_run_test(name, test_func) for name, test_func in tests]
     
     print("\n" + "=" * 50)
     print("📊 Test Results Summary:")
@@ -32,14 +32,9 @@ def test_shapes():
         
         # Check _hash_to_embedding internal logic
         embed_dim = hidden_dim
-        positions = torch.arange(embed_dim, device=layer.neural_hasher.device, dtype=torch.float32)
-        print(f"Positions shape: {positions.shape}")
-        
-        div_term = torch.exp(
-            torch.arange(0, embed_dim, 2, device=layer.neural_hasher.device, dtype=torch.float32) * 
-            -(3.14159 / embed_dim) # simplified for test
-        )
+        div_term = layer.neural_hasher._get_div_term(embed_dim)
         print(f"Div term shape: {div_term.shape}")
+        assert layer.neural_hasher._get_div_term(embed_dim) is div_term, "div_term was rebuilt"
         
         hash_floats = context_hashes.float().unsqueeze(-1)
         print(f"Hash floats shape: {hash_floats.shape}")